@@ -26,7 +26,7 @@ if TYPE_CHECKING:
 console = Console()
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentStep:
     """A single step in the agent's execution."""
 
@@ -39,7 +39,7 @@ class AgentStep:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentResult:
     """Result of an agent task execution."""
 
@@ -342,6 +342,8 @@ DeskPilotAgent = OllamaAgent
 class MockAgent:
     """Mock agent for testing without AI backend."""
 
+    step_delay: float = 0.1  # Seconds to pause after each step, simulating processing
+
     def __init__(self, computer: BaseComputer, config: DeskPilotConfig | None = None) -> None:
         self.computer = computer
         self.config = config or get_config()
@@ -380,7 +382,7 @@ class MockAgent:
             if verbose:
                 self._print_step(step)
             yield step
-            await asyncio.sleep(0.1)  # Simulate processing time
+            await asyncio.sleep(self.step_delay)  # Simulate processing time
 
     async def execute(self, task: str, verbose: bool | None = None) -> AgentResult:
         steps = [step async for step in self.run(task, verbose=verbose)]
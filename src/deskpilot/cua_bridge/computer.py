@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
@@ -174,42 +175,103 @@ class NativeComputer(BaseComputer):
 
 
 class MockComputer(BaseComputer):
-    """Mock computer for testing without actual native control."""
+    """Mock computer for testing without actual native control.
+
+    Actions are recorded column-wise: one list of action names and one of
+    argument tuples, with the argument names per action in _ACTION_FIELDS.
+    The dict view in `actions` is only built when something reads it.
+    """
+
+    _ACTION_FIELDS: dict[str, tuple[str, ...]] = {
+        "connect": (),
+        "disconnect": (),
+        "screenshot": (),
+        "click": ("x", "y", "button"),
+        "double_click": ("x", "y"),
+        "type_text": ("text",),
+        "press_key": ("key",),
+        "hotkey": ("keys",),
+    }
 
     def __init__(self, config: DeskPilotConfig) -> None:
         self.config = config
         self._connected = False
-        self.actions: list[dict] = []  # Record actions for testing
+        self.action_names: list[str] = []  # Record actions for testing
+        self.action_args: list[tuple] = []
+        self._action_index: set[tuple[str, tuple]] = set()
+
+    def _record(self, name: str, *args: object) -> None:
+        """Record an action in order and in the membership index.
+
+        Callers intern short vocabulary strings (buttons, key names) so the
+        many recorded copies share one object and compare by identity.
+        """
+        self.action_names.append(name)
+        self.action_args.append(args)
+        self._action_index.add((name, args))
+
+    @property
+    def actions(self) -> tuple[dict, ...]:
+        """Recorded actions as dicts, e.g. {"action": "click", "x": 1, ...}.
+
+        This is a read-only snapshot built on each access; use reset() to
+        clear the log.
+        """
+        return tuple(
+            {"action": name, **dict(zip(self._ACTION_FIELDS[name], args, strict=True))}
+            for name, args in zip(self.action_names, self.action_args, strict=True)
+        )
+
+    def contains(self, action: dict) -> bool:
+        """Check whether an action was recorded, without scanning the log."""
+        name = action.get("action")
+        if not isinstance(name, str):
+            return False
+        fields = self._ACTION_FIELDS.get(name)
+        if fields is None or len(action) != len(fields) + 1:
+            return False
+        try:
+            args = tuple(action[field] for field in fields)
+        except KeyError:
+            return False
+        return (name, args) in self._action_index
+
+    def reset(self) -> None:
+        """Return to the freshly constructed state so the instance can be reused."""
+        self._connected = False
+        self.action_names.clear()
+        self.action_args.clear()
+        self._action_index.clear()
 
     async def connect(self) -> None:
         self._connected = True
-        self.actions.append({"action": "connect"})
+        self._record("connect")
 
     async def disconnect(self) -> None:
         self._connected = False
-        self.actions.append({"action": "disconnect"})
+        self._record("disconnect")
 
     async def screenshot(self) -> Image.Image:
         from PIL import Image
 
-        self.actions.append({"action": "screenshot"})
+        self._record("screenshot")
         # Return a blank image
         return Image.new("RGB", (1920, 1080), color=(50, 50, 50))
 
     async def click(self, x: int, y: int, button: str = "left") -> None:
-        self.actions.append({"action": "click", "x": x, "y": y, "button": button})
+        self._record("click", x, y, sys.intern(button))
 
     async def double_click(self, x: int, y: int) -> None:
-        self.actions.append({"action": "double_click", "x": x, "y": y})
+        self._record("double_click", x, y)
 
     async def type_text(self, text: str) -> None:
-        self.actions.append({"action": "type_text", "text": text})
+        self._record("type_text", text)
 
     async def press_key(self, key: str) -> None:
-        self.actions.append({"action": "press_key", "key": key})
+        self._record("press_key", sys.intern(key))
 
     async def hotkey(self, *keys: str) -> None:
-        self.actions.append({"action": "hotkey", "keys": keys})
+        self._record("hotkey", tuple(map(sys.intern, keys)))
 
     def get_screen_info(self) -> ScreenInfo:
         return ScreenInfo(width=1920, height=1080)
@@ -2,18 +2,55 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import platform
 import shutil
 import subprocess
 import sys
+import time
 from dataclasses import dataclass
+from enum import Enum
 from pathlib import Path
 
+import httpx
 from rich.console import Console
 from rich.panel import Panel
+from rich.progress import BarColumn, DownloadColumn, Progress, TextColumn
+from rich.table import Table
+
+from deskpilot.wizard import _probes
+from deskpilot.wizard.config import get_config
 
 console = Console()
 
+OLLAMA_INSTALL_SCRIPT_URL = "https://ollama.ai/install.sh"
+MODEL_PULL_TIMEOUT = 3600.0  # seconds for the whole pull
+MODEL_PULL_READ_TIMEOUT = 300.0  # seconds without a progress line
+SKILL_SOURCE = Path(__file__).parent.parent / "openclaw_skill" / "computer-use"
+
+
+class Platform(Enum):
+    """Host platforms the installer knows how to handle."""
+
+    MACOS = "Darwin"
+    LINUX = "Linux"
+    WINDOWS = "Windows"
+    OTHER = "Other"
+
+
+_PLATFORMS = {p.value: p for p in Platform}
+
+
+def _tree_fingerprint(root: Path) -> str:
+    """Fingerprint a directory tree from relative paths, sizes and mtimes."""
+    digest = hashlib.sha256()
+    for path in sorted(p for p in root.rglob("*") if p.is_file()):
+        stat = path.stat()
+        entry = f"{path.relative_to(root).as_posix()}\0{stat.st_size}\0{stat.st_mtime_ns}\n"
+        digest.update(entry.encode())
+    return digest.hexdigest()
+
 
 @dataclass
 class InstallResult:
@@ -32,11 +69,15 @@ class NativeInstaller:
         skip_ollama: bool = False,
         skip_openclaw: bool = False,
         model: str = "qwen2.5:3b",
+        ollama_url: str | None = None,
     ):
         self.skip_ollama = skip_ollama
         self.skip_openclaw = skip_openclaw
         self.model = model
-        self.system = platform.system()
+        self.ollama_url = ollama_url or get_config().model.base_url
+        self._http: httpx.Client | None = None
+        self.system = _probes.system()
+        self.platform = _PLATFORMS.get(self.system, Platform.OTHER)
         self.arch = platform.machine()
 
     def check_python(self) -> InstallResult:
@@ -54,7 +95,7 @@ class NativeInstaller:
 
     def check_ollama(self) -> InstallResult:
         """Check if Ollama is installed."""
-        if shutil.which("ollama"):
+        if _probes.which("ollama"):
             return InstallResult(success=True, message="Ollama found")
         return InstallResult(success=False, message="Ollama not found")
 
@@ -63,21 +104,15 @@ class NativeInstaller:
         console.print("[blue]Installing Ollama...[/blue]")
 
         try:
-            if self.system == "Darwin":
+            if self.platform is Platform.MACOS:
                 # macOS - try brew first
                 if shutil.which("brew"):
                     subprocess.run(["brew", "install", "ollama"], check=True)
                 else:
-                    subprocess.run(
-                        ["sh", "-c", "curl -fsSL https://ollama.ai/install.sh | sh"],
-                        check=True,
-                    )
-            elif self.system == "Linux":
-                subprocess.run(
-                    ["sh", "-c", "curl -fsSL https://ollama.ai/install.sh | sh"],
-                    check=True,
-                )
-            elif self.system == "Windows":
+                    self._run_ollama_install_script()
+            elif self.platform is Platform.LINUX:
+                self._run_ollama_install_script()
+            elif self.platform is Platform.WINDOWS:
                 console.print(
                     "[yellow]Please download Ollama from https://ollama.ai/download[/yellow]"
                 )
@@ -92,31 +127,56 @@ class NativeInstaller:
                 )
 
             return InstallResult(success=True, message="Ollama installed")
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, httpx.HTTPError, ValueError) as e:
             return InstallResult(
                 success=False,
                 message="Failed to install Ollama",
                 details=str(e),
             )
 
+    def _run_ollama_install_script(self) -> None:
+        """Download the official install script and run it in a single shell."""
+        response = httpx.get(OLLAMA_INSTALL_SCRIPT_URL, follow_redirects=True, timeout=30.0)
+        response.raise_for_status()
+        script = response.content
+        if not script.startswith(b"#!"):
+            raise ValueError(f"Unexpected content from {OLLAMA_INSTALL_SCRIPT_URL}")
+        subprocess.run(["sh"], input=script, check=True)
+
+    def _ollama_client(self) -> httpx.Client:
+        """Get the keep-alive HTTP client for the Ollama API."""
+        if self._http is None:
+            self._http = httpx.Client(base_url=self.ollama_url, timeout=2.0)
+        return self._http
+
+    def close(self) -> None:
+        """Close the keep-alive HTTP client, if one was opened."""
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
+    def _ollama_running(self) -> bool:
+        """Check whether the Ollama daemon answers, reusing the keep-alive client."""
+        return _probes.ollama_running(self.ollama_url, timeout=2.0, client=self._ollama_client())
+
     def start_ollama_service(self) -> InstallResult:
         """Start Ollama service if not running."""
-        try:
-            result = subprocess.run(
-                ["ollama", "list"],
-                capture_output=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                return InstallResult(success=True, message="Ollama service running")
+        if self._ollama_running():
+            return InstallResult(success=True, message="Ollama service running")
 
+        try:
             # Try to start the service
-            if self.system == "Darwin" or self.system == "Linux":
+            if self.platform in (Platform.MACOS, Platform.LINUX):
                 subprocess.Popen(
                     ["ollama", "serve"],
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL,
                 )
+                # Give the daemon a moment to bind before pulling the model
+                for _ in range(20):
+                    if self._ollama_running():
+                        break
+                    time.sleep(0.25)
             return InstallResult(success=True, message="Ollama service started")
         except Exception as e:
             return InstallResult(
@@ -129,13 +189,44 @@ class NativeInstaller:
         """Pull the AI model."""
         console.print(f"[blue]Pulling model {self.model}...[/blue]")
 
+        deadline = time.monotonic() + MODEL_PULL_TIMEOUT
         try:
-            subprocess.run(["ollama", "pull", self.model], check=True)
+            with (
+                Progress(
+                    TextColumn("{task.description}"),
+                    BarColumn(),
+                    DownloadColumn(),
+                    console=console,
+                    transient=True,
+                ) as progress,
+                self._ollama_client().stream(
+                    "POST",
+                    "/api/pull",
+                    json={"model": self.model},
+                    timeout=httpx.Timeout(5.0, read=MODEL_PULL_READ_TIMEOUT),
+                ) as response,
+            ):
+                response.raise_for_status()
+                task = progress.add_task(f"Pulling {self.model}", total=None)
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    event = json.loads(line)
+                    if "error" in event:
+                        raise RuntimeError(event["error"])
+                    progress.update(
+                        task,
+                        description=event.get("status", ""),
+                        total=event.get("total"),
+                        completed=event.get("completed"),
+                    )
+                    if time.monotonic() > deadline:
+                        raise TimeoutError(f"Pull did not finish within {MODEL_PULL_TIMEOUT:.0f}s")
             return InstallResult(
                 success=True,
                 message=f"Model {self.model} ready",
             )
-        except subprocess.CalledProcessError as e:
+        except (httpx.HTTPError, RuntimeError, TimeoutError, json.JSONDecodeError) as e:
             return InstallResult(
                 success=False,
                 message=f"Failed to pull model {self.model}",
@@ -144,26 +235,8 @@ class NativeInstaller:
 
     def check_node(self) -> InstallResult:
         """Check if Node.js is installed."""
-        if not shutil.which("node"):
-            return InstallResult(success=False, message="Node.js not found")
-
         try:
-            result = subprocess.run(
-                ["node", "-v"],
-                capture_output=True,
-                text=True,
-            )
-            version = result.stdout.strip().lstrip("v")
-            major = int(version.split(".")[0])
-            if major >= 18:
-                return InstallResult(
-                    success=True,
-                    message=f"Node.js v{major} found",
-                )
-            return InstallResult(
-                success=False,
-                message=f"Node.js 18+ required (found v{major})",
-            )
+            major = _probes.node_major_version()
         except Exception as e:
             return InstallResult(
                 success=False,
@@ -171,6 +244,18 @@ class NativeInstaller:
                 details=str(e),
             )
 
+        if major is None:
+            return InstallResult(success=False, message="Node.js not found")
+        if major >= 18:
+            return InstallResult(
+                success=True,
+                message=f"Node.js v{major} found",
+            )
+        return InstallResult(
+            success=False,
+            message=f"Node.js 18+ required (found v{major})",
+        )
+
     def install_openclaw(self) -> InstallResult:
         """Install OpenClaw globally via npm."""
         console.print("[blue]Installing OpenClaw...[/blue]")
@@ -192,8 +277,7 @@ class NativeInstaller:
         """Install the computer-use skill to OpenClaw directory."""
         console.print("[blue]Installing computer-use skill...[/blue]")
 
-        # Find skill source
-        skill_src = Path(__file__).parent.parent / "openclaw_skill" / "computer-use"
+        skill_src = SKILL_SOURCE
         skill_dest = Path.home() / ".openclaw" / "skills" / "computer-use"
 
         if not skill_src.exists():
@@ -204,6 +288,16 @@ class NativeInstaller:
             )
 
         try:
+            # copytree preserves mtimes, so an intact install fingerprints
+            # the same as its source; a stale or damaged one does not
+            if skill_dest.is_dir() and (
+                _tree_fingerprint(skill_dest) == _tree_fingerprint(skill_src)
+            ):
+                return InstallResult(
+                    success=True,
+                    message=f"Skill already up to date at {skill_dest}",
+                )
+
             skill_dest.parent.mkdir(parents=True, exist_ok=True)
             if skill_dest.exists():
                 shutil.rmtree(skill_dest)
@@ -241,17 +335,8 @@ class NativeInstaller:
             errors.append("deskpilot not in PATH")
 
         # Check Ollama
-        if not self.skip_ollama:
-            try:
-                result = subprocess.run(
-                    ["ollama", "list"],
-                    capture_output=True,
-                    timeout=5,
-                )
-                if result.returncode != 0:
-                    errors.append("ollama list failed")
-            except Exception as e:
-                errors.append(f"ollama: {e}")
+        if not self.skip_ollama and not self._ollama_running():
+            errors.append(f"Ollama service not reachable at {self.ollama_url}")
 
         if errors:
             return InstallResult(
@@ -263,6 +348,13 @@ class NativeInstaller:
 
     def run(self) -> bool:
         """Run the full installation process."""
+        try:
+            return self._run()
+        finally:
+            self.close()
+
+    def _run(self) -> bool:
+        """Run each installation step, then print the summary and smoke test."""
         console.print(
             Panel(
                 "[bold blue]DeskPilot Installer[/bold blue]\n"
@@ -310,10 +402,12 @@ class NativeInstaller:
         steps.append(("Skill", result))
 
         # Show results
-        console.print("\n[bold]Installation Summary:[/bold]\n")
+        summary = Table.grid(padding=(0, 1))
         for name, result in steps:
             status = "[green]OK[/green]" if result.success else "[red]FAIL[/red]"
-            console.print(f"  {status} {name}: {result.message}")
+            summary.add_row(f"  {status}", f"{name}:", result.message)
+        console.print("\n[bold]Installation Summary:[/bold]\n")
+        console.print(summary)
 
         # Smoke test
         console.print()
@@ -0,0 +1,88 @@
+"""Environment probes shared by the setup wizard and the installer."""
+
+from __future__ import annotations
+
+import functools
+import importlib.util
+import platform
+import shutil
+import subprocess
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import httpx
+
+
+@functools.cache
+def which(name: str) -> str | None:
+    """Cached shutil.which; PATH does not change during a run."""
+    return shutil.which(name)
+
+
+@functools.lru_cache(maxsize=1)
+def system() -> str:
+    """Cached platform.system()."""
+    return platform.system()
+
+
+@functools.lru_cache(maxsize=1)
+def python_version_tuple() -> tuple[str, str, str]:
+    """Cached platform.python_version_tuple()."""
+    return platform.python_version_tuple()
+
+
+def clear_cache() -> None:
+    """Forget cached PATH and platform lookups (mainly for tests)."""
+    which.cache_clear()
+    system.cache_clear()
+    python_version_tuple.cache_clear()
+
+
+def ollama_running(base_url: str, timeout: float = 1.0, client: httpx.Client | None = None) -> bool:
+    """Check whether the Ollama daemon answers on its HTTP API.
+
+    Args:
+        base_url: Ollama API root, e.g. http://localhost:11434.
+        timeout: Seconds to wait for the answer.
+        client: Optional keep-alive client to send the request through.
+    """
+    import httpx
+
+    url = f"{base_url.rstrip('/')}/api/tags"
+    try:
+        if client is None:
+            response = httpx.get(url, timeout=timeout)
+        else:
+            response = client.get(url, timeout=timeout)
+        return response.status_code == 200
+    except httpx.HTTPError:
+        return False
+
+
+def native_packages_available() -> bool:
+    """Check whether the native control packages are installed.
+
+    Uses find_spec rather than importing: pyautogui connects to the
+    display at import time, which is slow and fails on headless hosts.
+    """
+    return all(importlib.util.find_spec(name) is not None for name in ("pyautogui", "mss", "PIL"))
+
+
+def node_major_version() -> int | None:
+    """Get the major version of the Node.js on PATH.
+
+    Returns:
+        Major version, or None if node is not on PATH.
+
+    Raises:
+        ValueError: If the `node -v` output cannot be parsed.
+    """
+    if not which("node"):
+        return None
+    result = subprocess.run(
+        ["node", "-v"],
+        capture_output=True,
+        text=True,
+    )
+    version = result.stdout.strip().lstrip("v")
+    return int(version.split(".")[0])
@@ -1,17 +1,26 @@
 """Configuration management for DeskPilot."""
 
+import functools
 import os
 from pathlib import Path
 from typing import Literal
 
 import yaml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+try:  # libyaml C bindings, several times faster than the pure-Python codec
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
 
 class NativeConfig(BaseModel):
     """Native control configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     screenshot_delay: float = 0.5
     typing_interval: float = 0.05
     click_pause: float = 0.1
@@ -20,6 +29,8 @@ class NativeConfig(BaseModel):
 class ModelConfig(BaseModel):
     """AI model configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     provider: str = "ollama"
     name: str = "qwen2.5:3b"
     base_url: str = "http://localhost:11434"
@@ -28,6 +39,8 @@ class ModelConfig(BaseModel):
 class AgentConfig(BaseModel):
     """Agent behavior configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     max_steps: int = 50
     screenshot_on_step: bool = True
     verbose: bool = True
@@ -36,6 +49,8 @@ class AgentConfig(BaseModel):
 class OpenClawConfig(BaseModel):
     """OpenClaw integration configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     enabled: bool = True
     skill_path: str = "~/.openclaw/skills/computer-use"
     daemon_url: str = "http://localhost:3000"
@@ -45,6 +60,8 @@ class OpenClawConfig(BaseModel):
 class LoggingConfig(BaseModel):
     """Logging configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
     file: str | None = None
     screenshots_dir: str = "./screenshots"
@@ -57,6 +74,7 @@ class DeskPilotConfig(BaseSettings):
         env_prefix="DESKPILOT_",
         env_nested_delimiter="__",
         extra="ignore",
+        frozen=True,
     )
 
     model: ModelConfig = Field(default_factory=ModelConfig)
@@ -100,6 +118,18 @@ def find_config_file() -> Path | None:
     return None
 
 
+@functools.lru_cache(maxsize=32)
+def _read_config_file(path: str, signature: tuple[int, ...]) -> dict:
+    """Parse a YAML config file, memoized on its path and stat signature.
+
+    The signature (inode, size, mtime and ctime) is part of the key so edits
+    are picked up even when a tool preserves the mtime; callers must treat
+    the returned dict as read-only.
+    """
+    with open(path) as f:
+        return yaml.load(f, Loader=SafeLoader) or {}
+
+
 def load_config(config_path: Path | str | None = None) -> DeskPilotConfig:
     """Load configuration from YAML file with environment variable overrides.
 
@@ -116,8 +146,9 @@ def load_config(config_path: Path | str | None = None) -> DeskPilotConfig:
 
     # Load YAML if found
     if path and path.exists():
-        with open(path) as f:
-            config_data = yaml.safe_load(f) or {}
+        st = path.stat()
+        signature = (st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+        config_data = _read_config_file(str(path), signature)
 
     # Create config with YAML data as defaults, env vars override
     return DeskPilotConfig(**config_data)
@@ -137,7 +168,7 @@ def save_config(config: DeskPilotConfig, path: Path | str) -> None:
     data = config.model_dump(mode="json")
 
     with open(path, "w") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(data, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
 
 
 def get_config() -> DeskPilotConfig:
@@ -1,78 +1,102 @@
-"""Dependency checking and status utilities for DeskPilot."""
+"""Dependency checking and status utilities for DeskPilot.
+
+Only the standard library is imported at module load. Rich and the
+config loader are pulled in when check_dependencies runs, so
+detect_environment stays cheap to import and call.
+"""
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import platform
-import shutil
 import subprocess
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+from deskpilot.wizard import _probes
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.text import Text
+
+# (label, results key, note) for each row of the status table
+_STATUS_ROWS = (
+    ("Python 3.11+", "python_3.11+", f"Current: {platform.python_version()}"),
+    ("Ollama", "ollama", "Local AI inference"),
+    ("Ollama Service", "ollama_running", "Run: ollama serve"),
+    ("Native packages", "native-packages", "pyautogui + mss + pillow"),
+    ("Node.js 18+", "node_18+", "Required for OpenClaw"),
+    ("OpenClaw", "openclaw", "TUI interface"),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _console() -> Console:
+    """Create the Rich console on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+@functools.lru_cache(maxsize=1)
+def _status_cells() -> tuple[Text, Text]:
+    """Parse the "OK" and "Missing" status cells once."""
+    from rich.text import Text
 
-from rich.console import Console
-from rich.table import Table
+    return Text.from_markup("[green]OK[/green]"), Text.from_markup("[red]Missing[/red]")
 
-console = Console()
+
+def clear_cache() -> None:
+    """Forget cached PATH, platform and environment lookups (mainly for tests)."""
+    _probes.clear_cache()
+    detect_environment.cache_clear()
+
+
+def _node_18_available() -> bool:
+    """Check whether Node.js 18+ is on PATH."""
+    try:
+        major = _probes.node_major_version()
+    except Exception:
+        return False
+    return major is not None and major >= 18
 
 
 async def check_dependencies() -> dict[str, bool]:
     """Check which dependencies are available.
 
+    The slow probes (the Ollama API ping and the Node.js version check)
+    run concurrently, so the total time is bounded by the slowest probe.
+
     Returns:
         Dict mapping dependency name to availability.
     """
+    from rich.table import Table
+
+    from deskpilot.wizard.config import get_config
+
+    ollama_running, node_18 = await asyncio.gather(
+        asyncio.to_thread(_probes.ollama_running, get_config().model.base_url),
+        asyncio.to_thread(_node_18_available),
+    )
+
     results = {}
 
     # Check Python version
-    py_version = platform.python_version_tuple()
+    py_version = _probes.python_version_tuple()
     results["python_3.11+"] = int(py_version[0]) >= 3 and int(py_version[1]) >= 11
 
-    # Check Ollama
-    results["ollama"] = shutil.which("ollama") is not None
-
-    # Check if Ollama is running
-    if results["ollama"]:
-        try:
-            result = subprocess.run(
-                ["ollama", "list"],
-                capture_output=True,
-                timeout=5,
-            )
-            results["ollama_running"] = result.returncode == 0
-        except Exception:
-            results["ollama_running"] = False
-    else:
-        results["ollama_running"] = False
-
-    # Check for native packages
-    try:
-        import mss  # noqa: F401
-        import pyautogui  # noqa: F401
-
-        results["native-packages"] = True
-    except ImportError:
-        results["native-packages"] = False
-
-    # Check OpenClaw
-    results["openclaw"] = shutil.which("openclaw") is not None
-
-    # Check Node.js
-    if shutil.which("node"):
-        try:
-            result = subprocess.run(
-                ["node", "-v"],
-                capture_output=True,
-                text=True,
-            )
-            version = result.stdout.strip().lstrip("v")
-            major = int(version.split(".")[0])
-            results["node_18+"] = major >= 18
-        except Exception:
-            results["node_18+"] = False
-    else:
-        results["node_18+"] = False
+    results["ollama"] = _probes.which("ollama") is not None
+    results["ollama_running"] = ollama_running
+    results["native-packages"] = _probes.native_packages_available()
+    results["openclaw"] = _probes.which("openclaw") is not None
+    results["node_18+"] = node_18
 
     # Check system
-    results["is_windows"] = platform.system() == "Windows"
-    results["is_macos"] = platform.system() == "Darwin"
-    results["is_linux"] = platform.system() == "Linux"
+    results["is_windows"] = _probes.system() == "Windows"
+    results["is_macos"] = _probes.system() == "Darwin"
+    results["is_linux"] = _probes.system() == "Linux"
 
     # Print status table
     table = Table(title="DeskPilot Status")
@@ -80,40 +104,11 @@ async def check_dependencies() -> dict[str, bool]:
     table.add_column("Status", style="green")
     table.add_column("Notes", style="dim")
 
-    def status_str(available: bool) -> str:
-        return "[green]OK[/green]" if available else "[red]Missing[/red]"
-
-    table.add_row(
-        "Python 3.11+",
-        status_str(results["python_3.11+"]),
-        f"Current: {platform.python_version()}",
-    )
-    table.add_row(
-        "Ollama",
-        status_str(results["ollama"]),
-        "Local AI inference",
-    )
-    table.add_row(
-        "Ollama Service",
-        status_str(results["ollama_running"]),
-        "Run: ollama serve",
-    )
-    table.add_row(
-        "Native packages",
-        status_str(results["native-packages"]),
-        "pyautogui + mss + pillow",
-    )
-    table.add_row(
-        "Node.js 18+",
-        status_str(results["node_18+"]),
-        "Required for OpenClaw",
-    )
-    table.add_row(
-        "OpenClaw",
-        status_str(results["openclaw"]),
-        "TUI interface",
-    )
+    ok, missing = _status_cells()
+    for label, key, note in _STATUS_ROWS:
+        table.add_row(label, ok if results[key] else missing, note)
 
+    console = _console()
     console.print(table)
 
     # Show recommendations
@@ -137,14 +132,49 @@ async def check_dependencies() -> dict[str, bool]:
     return results
 
 
-def detect_environment() -> dict:
+def _macos_ram_bytes() -> int:
+    """Read hw.memsize via sysctlbyname, falling back to the sysctl CLI."""
+    import ctypes
+    import ctypes.util
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"))
+        sysctlbyname = libc.sysctlbyname
+        # int sysctlbyname(const char *, void *, size_t *, void *, size_t)
+        sysctlbyname.argtypes = [
+            ctypes.c_char_p,
+            ctypes.c_void_p,
+            ctypes.POINTER(ctypes.c_size_t),
+            ctypes.c_void_p,
+            ctypes.c_size_t,
+        ]
+        sysctlbyname.restype = ctypes.c_int
+        size = ctypes.c_uint64(0)
+        length = ctypes.c_size_t(ctypes.sizeof(size))
+        if sysctlbyname(b"hw.memsize", ctypes.byref(size), ctypes.byref(length), None, 0) == 0:
+            return size.value
+    except (OSError, AttributeError):
+        pass
+
+    result = subprocess.run(
+        ["sysctl", "-n", "hw.memsize"],
+        capture_output=True,
+        text=True,
+    )
+    return int(result.stdout.strip())
+
+
+@functools.lru_cache(maxsize=1)
+def detect_environment() -> Mapping[str, Any]:
     """Detect the current environment.
 
+    The result is computed once per process and shared between callers.
+
     Returns:
-        Dict with environment details.
+        Read-only mapping with environment details.
     """
     env = {
-        "os": platform.system(),
+        "os": _probes.system(),
         "os_version": platform.version(),
         "python_version": platform.python_version(),
         "arch": platform.machine(),
@@ -152,23 +182,19 @@ def detect_environment() -> dict:
 
     # Check RAM (approximate)
     try:
-        if platform.system() == "Darwin":
-            result = subprocess.run(
-                ["sysctl", "-n", "hw.memsize"],
-                capture_output=True,
-                text=True,
-            )
-            env["ram_gb"] = int(result.stdout.strip()) // (1024**3)
-        elif platform.system() == "Linux":
-            with open("/proc/meminfo") as f:
-                for line in f:
-                    if line.startswith("MemTotal"):
-                        kb = int(line.split()[1])
-                        env["ram_gb"] = kb // (1024**2)
-                        break
+        if _probes.system() == "Darwin":
+            env["ram_gb"] = _macos_ram_bytes() // (1024**3)
+        elif _probes.system() == "Linux":
+            # MemTotal is the first line, e.g. b"MemTotal:  16314436 kB"
+            with open("/proc/meminfo", "rb") as f:
+                head = f.read(64)
+            if not head.startswith(b"MemTotal:"):
+                raise ValueError("Unexpected /proc/meminfo layout")
+            kb = int(head.split(b":", 1)[1].split()[0])
+            env["ram_gb"] = kb // (1024**2)
         else:
             env["ram_gb"] = 8  # Default assumption
     except Exception:
         env["ram_gb"] = 8
 
-    return env
+    return MappingProxyType(env)
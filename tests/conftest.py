@@ -1,27 +1,40 @@
 """Pytest configuration and shared fixtures."""
 
 import pytest
+from click.testing import CliRunner
 
 from deskpilot.cua_bridge.computer import MockComputer
 from deskpilot.wizard.config import DeskPilotConfig
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def runner():
+    """Create a CLI test runner shared by all tests (invoke isolates I/O)."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
 def config():
-    """Create a default DeskPilotConfig."""
+    """Create one default DeskPilotConfig; configs are frozen, so sharing is safe."""
     return DeskPilotConfig()
 
 
+@pytest.fixture(scope="session")
+def shared_mock_computer(config):
+    """Create one MockComputer for the whole run."""
+    return MockComputer(config)
+
+
 @pytest.fixture
-def mock_computer(config):
-    """Create a connected MockComputer."""
-    computer = MockComputer(config)
-    return computer
+def mock_computer(shared_mock_computer):
+    """Hand out the shared MockComputer, reset to a disconnected, empty state."""
+    shared_mock_computer.reset()
+    return shared_mock_computer
 
 
 @pytest.fixture
 async def connected_mock_computer(mock_computer):
-    """Create a connected MockComputer (async fixture)."""
+    """Hand out the shared MockComputer, reset and connected (async fixture)."""
     await mock_computer.connect()
     yield mock_computer
     await mock_computer.disconnect()
@@ -18,10 +18,14 @@ pytestmark = pytest.mark.skipif(
     reason="E2E tests require DESKPILOT_E2E=1 and running Docker container",
 )
 
+# noVNC keeps a websocket open, so "networkidle" never settles; wait for
+# the first interactive element instead.
+NOVNC_READY_SELECTOR = "canvas, button, input"
 
-@pytest.fixture
-def browser_page():
-    """Create a Playwright browser page."""
+
+@pytest.fixture(scope="session")
+def browser():
+    """Launch one headless Chromium for the whole session."""
     try:
         from playwright.sync_api import sync_playwright
     except ImportError:
@@ -29,11 +33,19 @@ def browser_page():
 
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        yield page
+        yield browser
         browser.close()
 
 
+@pytest.fixture
+def browser_page(browser):
+    """Create a Playwright page in a fresh browser context."""
+    context = browser.new_context()
+    page = context.new_page()
+    yield page
+    context.close()
+
+
 class TestDockerDemo:
     """Tests for the Docker demo noVNC interface."""
 
@@ -43,7 +55,7 @@ class TestDockerDemo:
 
         # Navigate to noVNC interface
         page.goto("http://localhost:8006", timeout=30000)
-        page.wait_for_load_state("networkidle", timeout=30000)
+        page.wait_for_selector(NOVNC_READY_SELECTOR, state="attached", timeout=30000)
 
         # Take screenshot for inspection
         page.screenshot(path="/tmp/deskpilot_novnc.png", full_page=True)
@@ -58,7 +70,7 @@ class TestDockerDemo:
         page = browser_page
 
         page.goto("http://localhost:8006", timeout=30000)
-        page.wait_for_load_state("networkidle", timeout=30000)
+        page.wait_for_selector(NOVNC_READY_SELECTOR, state="attached", timeout=30000)
 
         # Look for connect/start button or VNC canvas
         buttons = page.locator("button").all()
@@ -76,10 +88,7 @@ class TestDemoScreenshot:
         page = browser_page
 
         page.goto("http://localhost:8006", timeout=30000)
-        page.wait_for_load_state("networkidle", timeout=30000)
-
-        # Wait for potential VNC connection
-        page.wait_for_timeout(3000)
+        page.wait_for_selector(NOVNC_READY_SELECTOR, state="attached", timeout=30000)
 
         # Capture final state
         screenshot_path = "/tmp/deskpilot_demo_state.png"
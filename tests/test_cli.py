@@ -1,30 +1,34 @@
 """Tests for the CLI module."""
 
-
+import click
 import pytest
-from click.testing import CliRunner
+import yaml
 
 from deskpilot.cli import cli
 
 
+def help_of(*path: str) -> str:
+    """Render a (sub)command's help text without going through CliRunner."""
+    ctx = click.Context(cli, info_name="deskpilot")
+    cmd = cli
+    for name in path:
+        cmd = cmd.get_command(ctx, name)
+        ctx = click.Context(cmd, info_name=name, parent=ctx)
+    return cmd.get_help(ctx)
+
+
 class TestCLI:
     """Tests for CLI commands."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create a CLI test runner."""
-        return CliRunner()
-
-    def test_cli_help(self, runner):
+    def test_cli_help(self):
         """Test CLI help output."""
-        result = runner.invoke(cli, ["--help"])
+        output = help_of()
 
-        assert result.exit_code == 0
-        assert "DeskPilot" in result.output
-        assert "install" in result.output
-        assert "demo" in result.output
-        assert "screenshot" in result.output
-        assert "status" in result.output
+        assert "DeskPilot" in output
+        assert "install" in output
+        assert "demo" in output
+        assert "screenshot" in output
+        assert "status" in output
 
     def test_cli_version(self, runner):
         """Test CLI version output."""
@@ -41,83 +45,31 @@ class TestCLI:
         assert "Model" in result.output
         assert "OpenClaw" in result.output
 
-    def test_screenshot_help(self, runner):
-        """Test screenshot command help."""
-        result = runner.invoke(cli, ["screenshot", "--help"])
-
-        assert result.exit_code == 0
-        assert "--save" in result.output
-        assert "--describe" in result.output
-
-    def test_click_help(self, runner):
-        """Test click command help."""
-        result = runner.invoke(cli, ["click", "--help"])
-
-        assert result.exit_code == 0
-        assert "--target" in result.output
-        assert "--button" in result.output
-        assert "--double" in result.output
-
-    def test_type_help(self, runner):
-        """Test type command help."""
-        result = runner.invoke(cli, ["type", "--help"])
-
-        assert result.exit_code == 0
-        assert "TEXT" in result.output
-
-    def test_launch_help(self, runner):
-        """Test launch command help."""
-        result = runner.invoke(cli, ["launch", "--help"])
-
-        assert result.exit_code == 0
-        assert "APP" in result.output
-
-    def test_run_help(self, runner):
-        """Test run command help."""
-        result = runner.invoke(cli, ["run", "--help"])
-
-        assert result.exit_code == 0
-        assert "--verbose" in result.output
-        assert "TASK" in result.output
-
-    def test_hotkey_help(self, runner):
-        """Test hotkey command help."""
-        result = runner.invoke(cli, ["hotkey", "--help"])
-
-        assert result.exit_code == 0
-        assert "KEYS" in result.output
-
-    def test_install_help(self, runner):
-        """Test install command help."""
-        result = runner.invoke(cli, ["install", "--help"])
-
-        assert result.exit_code == 0
-        assert "--skip-ollama" in result.output
-        assert "--skip-openclaw" in result.output
-        assert "--model" in result.output
-
-    def test_uninstall_help(self, runner):
-        """Test uninstall command help."""
-        result = runner.invoke(cli, ["uninstall", "--help"])
-
-        assert result.exit_code == 0
-
-    def test_tui_help(self, runner):
-        """Test tui command help."""
-        result = runner.invoke(cli, ["tui", "--help"])
-
-        assert result.exit_code == 0
-        assert "OpenClaw" in result.output or "TUI" in result.output
+    @pytest.mark.parametrize(
+        ("command", "expected"),
+        [
+            ("screenshot", ("--save", "--describe")),
+            ("click", ("--target", "--button", "--double")),
+            ("type", ("TEXT",)),
+            ("launch", ("APP",)),
+            ("run", ("--verbose", "TASK")),
+            ("hotkey", ("KEYS",)),
+            ("install", ("--skip-ollama", "--skip-openclaw", "--model")),
+            ("uninstall", ("Uninstall",)),
+            ("tui", ("OpenClaw",)),
+        ],
+    )
+    def test_subcommand_help(self, command, expected):
+        """Test each subcommand's help lists its options and arguments."""
+        output = help_of(command)
+
+        for text in expected:
+            assert text in output
 
 
 class TestCLIWithMock:
     """Tests for CLI commands with mocked backend."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create a CLI test runner."""
-        return CliRunner()
-
     def test_screenshot_mock_mode(self, runner):
         """Test screenshot command in mock mode."""
         result = runner.invoke(cli, ["screenshot", "--mock"])
@@ -178,11 +130,6 @@ class TestCLIWithMock:
 class TestCLIConfigOption:
     """Tests for CLI config option."""
 
-    @pytest.fixture
-    def runner(self):
-        """Create a CLI test runner."""
-        return CliRunner()
-
     def test_config_option_nonexistent_file(self, runner):
         """Test that nonexistent config file is rejected."""
         result = runner.invoke(cli, ["--config", "/nonexistent/config.yaml", "config"])
@@ -190,23 +137,13 @@ class TestCLIConfigOption:
         # Click should reject the file since exists=True
         assert result.exit_code != 0
 
-    def test_config_option_with_valid_file(self, runner):
+    def test_config_option_with_valid_file(self, runner, tmp_path):
         """Test config option with valid file."""
-        import tempfile
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.dump({"model": {"name": "custom-model"}}))
 
-        import yaml
+        result = runner.invoke(cli, ["--config", str(config_path), "config"])
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump({"model": {"name": "custom-model"}}, f)
-            config_path = f.name
-
-        try:
-            result = runner.invoke(cli, ["--config", config_path, "config"])
-
-            assert result.exit_code == 0
-            # Should show the loaded config
-            assert "custom-model" in result.output
-        finally:
-            import os
-
-            os.unlink(config_path)
+        assert result.exit_code == 0
+        # Should show the loaded config
+        assert "custom-model" in result.output
@@ -1,12 +1,14 @@
 """Tests for configuration management."""
 
-import tempfile
-from pathlib import Path
+import os
 
+import pytest
 import yaml
+from pydantic import ValidationError
 
 from deskpilot.wizard.config import (
     DeskPilotConfig,
+    LoggingConfig,
     ModelConfig,
     NativeConfig,
     OpenClawConfig,
@@ -15,18 +17,43 @@ from deskpilot.wizard.config import (
 )
 
 
+@pytest.fixture(scope="session")
+def config_dir(tmp_path_factory):
+    """Create one scratch directory for config files."""
+    return tmp_path_factory.mktemp("cfg")
+
+
+@pytest.fixture(scope="session")
+def partial_config_path(config_dir):
+    """Write a config file with only some values specified, once."""
+    path = config_dir / "partial.yaml"
+    path.write_text(yaml.safe_dump({"model": {"name": "custom-model"}}))
+    return path
+
+
 class TestDeskPilotConfig:
     """Tests for DeskPilotConfig model."""
 
-    def test_default_config(self):
+    @pytest.mark.parametrize(
+        ("field", "expected"),
+        [
+            ("model.provider", "ollama"),
+            ("model.name", "qwen2.5:3b"),
+            ("agent.max_steps", 50),
+            ("logging.level", "INFO"),
+            ("native.screenshot_delay", 0.5),
+            ("native.typing_interval", 0.05),
+            ("native.click_pause", 0.1),
+            ("openclaw.enabled", True),
+            ("openclaw.auto_start_tui", True),
+            ("openclaw.skill_path", "~/.openclaw/skills/computer-use"),
+        ],
+    )
+    def test_default_config(self, config, field, expected):
         """Test default configuration values."""
-        config = DeskPilotConfig()
+        section, name = field.split(".")
 
-        assert config.model.provider == "ollama"
-        assert config.model.name == "qwen2.5:3b"
-        assert config.agent.max_steps == 50
-        assert config.logging.level == "INFO"
-        assert config.openclaw.enabled is True
+        assert getattr(getattr(config, section), name) == expected
 
     def test_nested_config_override(self):
         """Test overriding nested config values."""
@@ -38,61 +65,75 @@ class TestDeskPilotConfig:
         assert config.model.name == "llama3.2-vision:11b"
         assert config.openclaw.enabled is False
 
-    def test_native_config_defaults(self):
-        """Test native configuration defaults."""
-        config = DeskPilotConfig()
-
-        assert config.native.screenshot_delay == 0.5
-        assert config.native.typing_interval == 0.05
-        assert config.native.click_pause == 0.1
+    def test_json_roundtrip(self):
+        """Test that a config survives a JSON dump/validate round trip."""
+        config = DeskPilotConfig(
+            model=ModelConfig(name="llama3.2-vision:11b"),
+            native=NativeConfig(typing_interval=0.1),
+        )
 
-    def test_openclaw_config_defaults(self):
-        """Test OpenClaw configuration defaults."""
-        config = DeskPilotConfig()
+        loaded = DeskPilotConfig.model_validate_json(config.model_dump_json())
 
-        assert config.openclaw.enabled is True
-        assert config.openclaw.auto_start_tui is True
-        assert "~/.openclaw/skills/computer-use" in config.openclaw.skill_path
+        assert loaded == config
 
 
 class TestConfigLoadSave:
     """Tests for config loading and saving."""
 
-    def test_save_and_load_config(self):
+    def test_save_and_load_config(self, config_dir):
         """Test saving and loading configuration."""
         config = DeskPilotConfig(
             model=ModelConfig(name="test-model"),
             native=NativeConfig(typing_interval=0.1),
         )
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "config.yaml"
-            save_config(config, config_path)
+        config_path = config_dir / "config.yaml"
+        save_config(config, config_path)
 
-            # Verify file exists
-            assert config_path.exists()
+        # Verify file exists
+        assert config_path.exists()
 
-            # Load and verify
-            loaded = load_config(config_path)
-            assert loaded.model.name == "test-model"
-            assert loaded.native.typing_interval == 0.1
+        # Load and verify
+        loaded = load_config(config_path)
+        assert loaded.model.name == "test-model"
+        assert loaded.native.typing_interval == 0.1
 
-    def test_load_partial_config(self):
+    def test_load_partial_config(self, partial_config_path):
         """Test loading config with only some values specified."""
-        partial_config = {
-            "model": {"name": "custom-model"},
-            # Other values should use defaults
-        }
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config_path = Path(tmpdir) / "config.yaml"
-            with open(config_path, "w") as f:
-                yaml.dump(partial_config, f)
-
-            loaded = load_config(config_path)
-            assert loaded.model.name == "custom-model"
-            assert loaded.model.provider == "ollama"  # Default
-            assert loaded.agent.max_steps == 50  # Default
+        loaded = load_config(partial_config_path)
+        assert loaded.model.name == "custom-model"
+        assert loaded.model.provider == "ollama"  # Default
+        assert loaded.agent.max_steps == 50  # Default
+
+    def test_load_config_picks_up_file_changes(self, config_dir):
+        """Test that a rewritten config file is re-read rather than served from cache."""
+        config_path = config_dir / "changing.yaml"
+        config_path.write_text(yaml.safe_dump({"agent": {"max_steps": 10}}))
+        assert load_config(config_path).agent.max_steps == 10
+
+        config_path.write_text(yaml.safe_dump({"agent": {"max_steps": 20}}))
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert load_config(config_path).agent.max_steps == 20
+
+    def test_load_config_detects_rewrite_with_same_mtime(self, config_dir):
+        """Test that a rewrite is picked up even when the mtime is preserved."""
+        config_path = config_dir / "same-mtime.yaml"
+        config_path.write_text(yaml.safe_dump({"agent": {"max_steps": 10}}))
+        assert load_config(config_path).agent.max_steps == 10
+        mtime = config_path.stat().st_mtime_ns
+
+        # Rewritten in place with a different size
+        config_path.write_text(yaml.safe_dump({"agent": {"max_steps": 100}}))
+        os.utime(config_path, ns=(mtime, mtime))
+        assert load_config(config_path).agent.max_steps == 100
+
+        # Replaced by a same-sized file, as `cp -p` or `rsync -t` would
+        replacement = config_dir / "same-mtime.yaml.tmp"
+        replacement.write_text(yaml.safe_dump({"agent": {"max_steps": 99}}))
+        os.utime(replacement, ns=(mtime, mtime))
+        replacement.replace(config_path)
+        assert load_config(config_path).agent.max_steps == 99
 
     def test_load_nonexistent_file(self):
         """Test loading when file doesn't exist returns defaults."""
@@ -106,13 +147,10 @@ class TestConfigLoadSave:
 class TestConfigValidation:
     """Tests for config validation."""
 
-    def test_valid_log_levels(self):
+    @pytest.mark.parametrize("level", ["DEBUG", "INFO", "WARNING", "ERROR"])
+    def test_valid_log_levels(self, level):
         """Test valid log level values."""
-        from deskpilot.wizard.config import LoggingConfig
-
-        for level in ["DEBUG", "INFO", "WARNING", "ERROR"]:
-            logging_config = LoggingConfig(level=level)
-            assert logging_config.level == level
+        assert LoggingConfig(level=level).level == level
 
     def test_native_config_values(self):
         """Test native configuration value handling."""
@@ -125,3 +163,10 @@ class TestConfigValidation:
         assert native_config.screenshot_delay == 1.0
         assert native_config.typing_interval == 0.1
         assert native_config.click_pause == 0.2
+
+    def test_config_is_frozen(self, config):
+        """Test that loaded configuration cannot be mutated in place."""
+        with pytest.raises(ValidationError):
+            config.model.name = "other-model"
+        with pytest.raises(ValidationError):
+            config.model = ModelConfig()
@@ -10,90 +10,102 @@ from deskpilot.cua_bridge.computer import (
     ScreenInfo,
     get_computer,
 )
-from deskpilot.wizard.config import DeskPilotConfig
+
+
+@pytest.fixture
+def actions(connected_mock_computer, config):
+    """Create Actions over the shared MockComputer, connected."""
+    return Actions(connected_mock_computer, config)
+
+
+@pytest.fixture
+def agent(mock_computer, config):
+    """Create a MockAgent over the shared MockComputer."""
+    return MockAgent(mock_computer, config)
 
 
 class TestMockComputer:
     """Tests for MockComputer."""
 
-    @pytest.fixture
-    def computer(self):
-        """Create a MockComputer instance."""
-        config = DeskPilotConfig()
-        return MockComputer(config)
-
-    @pytest.mark.asyncio
-    async def test_connect_disconnect(self, computer):
+    async def test_connect_disconnect(self, mock_computer):
         """Test connect and disconnect."""
-        assert not computer.is_connected
+        assert not mock_computer.is_connected
 
-        await computer.connect()
-        assert computer.is_connected
-        assert {"action": "connect"} in computer.actions
+        await mock_computer.connect()
+        assert mock_computer.is_connected
+        assert mock_computer.contains({"action": "connect"})
 
-        await computer.disconnect()
-        assert not computer.is_connected
-        assert {"action": "disconnect"} in computer.actions
+        await mock_computer.disconnect()
+        assert not mock_computer.is_connected
+        assert mock_computer.contains({"action": "disconnect"})
 
-    @pytest.mark.asyncio
-    async def test_screenshot(self, computer):
+    async def test_screenshot(self, connected_mock_computer):
         """Test screenshot capture."""
-        await computer.connect()
-
-        image = await computer.screenshot()
+        image = await connected_mock_computer.screenshot()
 
         assert image is not None
         assert image.size == (1920, 1080)
-        assert {"action": "screenshot"} in computer.actions
+        assert connected_mock_computer.contains({"action": "screenshot"})
 
-    @pytest.mark.asyncio
-    async def test_click(self, computer):
+    async def test_click(self, connected_mock_computer):
         """Test click action."""
-        await computer.connect()
-
-        await computer.click(100, 200, button="left")
+        await connected_mock_computer.click(100, 200, button="left")
 
-        assert {"action": "click", "x": 100, "y": 200, "button": "left"} in computer.actions
+        assert connected_mock_computer.contains(
+            {"action": "click", "x": 100, "y": 200, "button": "left"}
+        )
 
-    @pytest.mark.asyncio
-    async def test_double_click(self, computer):
+    async def test_double_click(self, connected_mock_computer):
         """Test double-click action."""
-        await computer.connect()
-
-        await computer.double_click(150, 250)
+        await connected_mock_computer.double_click(150, 250)
 
-        assert {"action": "double_click", "x": 150, "y": 250} in computer.actions
+        assert connected_mock_computer.contains({"action": "double_click", "x": 150, "y": 250})
 
-    @pytest.mark.asyncio
-    async def test_type_text(self, computer):
+    async def test_type_text(self, connected_mock_computer):
         """Test typing text."""
-        await computer.connect()
-
-        await computer.type_text("Hello, World!")
+        await connected_mock_computer.type_text("Hello, World!")
 
-        assert {"action": "type_text", "text": "Hello, World!"} in computer.actions
+        assert connected_mock_computer.contains({"action": "type_text", "text": "Hello, World!"})
 
-    @pytest.mark.asyncio
-    async def test_press_key(self, computer):
+    async def test_press_key(self, connected_mock_computer):
         """Test pressing a key."""
-        await computer.connect()
+        await connected_mock_computer.press_key("enter")
 
-        await computer.press_key("enter")
+        assert connected_mock_computer.contains({"action": "press_key", "key": "enter"})
 
-        assert {"action": "press_key", "key": "enter"} in computer.actions
-
-    @pytest.mark.asyncio
-    async def test_hotkey(self, computer):
+    async def test_hotkey(self, connected_mock_computer):
         """Test hotkey combination."""
-        await computer.connect()
+        await connected_mock_computer.hotkey("ctrl", "c")
+
+        assert connected_mock_computer.contains({"action": "hotkey", "keys": ("ctrl", "c")})
 
-        await computer.hotkey("ctrl", "c")
+    async def test_actions_view(self, connected_mock_computer):
+        """Test the dict view of the recorded actions."""
+        await connected_mock_computer.click(100, 200)
 
-        assert {"action": "hotkey", "keys": ("ctrl", "c")} in computer.actions
+        assert connected_mock_computer.actions == (
+            {"action": "connect"},
+            {"action": "click", "x": 100, "y": 200, "button": "left"},
+        )
+        assert not connected_mock_computer.contains({"action": "click", "x": 100, "y": 200})
+        assert not connected_mock_computer.contains({"action": None})
+        with pytest.raises(AttributeError):
+            connected_mock_computer.actions.clear()
 
-    def test_screen_info(self, computer):
+    async def test_reset(self, mock_computer):
+        """Test reset disconnects and forgets recorded actions."""
+        await mock_computer.connect()
+        await mock_computer.click(1, 2)
+
+        mock_computer.reset()
+
+        assert not mock_computer.is_connected
+        assert mock_computer.actions == ()
+        assert not mock_computer.contains({"action": "connect"})
+
+    def test_screen_info(self, mock_computer):
         """Test getting screen info."""
-        info = computer.get_screen_info()
+        info = mock_computer.get_screen_info()
 
         assert isinstance(info, ScreenInfo)
         assert info.width == 1920
@@ -109,10 +121,8 @@ class TestGetComputer:
 
         assert isinstance(computer, MockComputer)
 
-    def test_get_native_computer_type(self):
+    def test_get_native_computer_type(self, config):
         """Test that default mode returns NativeComputer type."""
-        config = DeskPilotConfig()
-
         computer = get_computer(config, mock=False)
 
         assert isinstance(computer, NativeComputer)
@@ -121,29 +131,16 @@ class TestGetComputer:
 class TestActions:
     """Tests for high-level Actions."""
 
-    @pytest.fixture
-    def actions(self):
-        """Create Actions with MockComputer."""
-        config = DeskPilotConfig()
-        computer = MockComputer(config)
-        return Actions(computer, config)
-
-    @pytest.mark.asyncio
     async def test_screenshot_action(self, actions):
         """Test screenshot action."""
-        await actions.computer.connect()
-
         result = await actions.screenshot()
 
         assert isinstance(result, ScreenshotResult)
         assert result.image is not None
         assert result.timestamp is not None
 
-    @pytest.mark.asyncio
     async def test_click_with_coordinates(self, actions):
         """Test click with coordinates."""
-        await actions.computer.connect()
-
         result = await actions.click(x=100, y=200)
 
         assert isinstance(result, ActionResult)
@@ -152,43 +149,31 @@ class TestActions:
         assert result.details["x"] == 100
         assert result.details["y"] == 200
 
-    @pytest.mark.asyncio
     async def test_click_without_coordinates_or_target(self, actions):
         """Test click fails without coordinates or target."""
-        await actions.computer.connect()
-
         result = await actions.click()
 
         assert not result.success
         assert "must be specified" in result.error
 
-    @pytest.mark.asyncio
     async def test_type_text_action(self, actions):
         """Test type_text action."""
-        await actions.computer.connect()
-
         result = await actions.type_text("test input")
 
         assert result.success
         assert result.action == "type_text"
         assert result.details["length"] == 10
 
-    @pytest.mark.asyncio
     async def test_launch_action(self, actions):
         """Test launch action."""
-        await actions.computer.connect()
-
         result = await actions.launch("Calculator")
 
         assert result.success
         assert result.action == "launch"
         assert result.details["app"] == "Calculator"
 
-    @pytest.mark.asyncio
     async def test_hotkey_action(self, actions):
         """Test hotkey action."""
-        await actions.computer.connect()
-
         result = await actions.hotkey("ctrl", "c")
 
         assert result.success
@@ -199,25 +184,14 @@ class TestActions:
 class TestMockAgent:
     """Tests for MockAgent."""
 
-    @pytest.fixture
-    def agent(self):
-        """Create a MockAgent instance."""
-        config = DeskPilotConfig()
-        computer = MockComputer(config)
-        return MockAgent(computer, config)
-
-    @pytest.mark.asyncio
     async def test_agent_run(self, agent):
         """Test agent run yields steps."""
-        steps = []
-        async for step in agent.run("test task", verbose=False):
-            steps.append(step)
+        steps = [step async for step in agent.run("test task", verbose=False)]
 
         assert len(steps) > 0
         assert all(isinstance(s, AgentStep) for s in steps)
         assert steps[0].step_number == 1
 
-    @pytest.mark.asyncio
     async def test_agent_execute(self, agent):
         """Test agent execute returns result."""
         result = await agent.execute("test task", verbose=False)
@@ -263,8 +237,8 @@ class TestAgentResult:
     def test_successful_result(self):
         """Test successful AgentResult."""
         steps = [
-            AgentStep(step_number=1, action="screenshot"),
-            AgentStep(step_number=2, action="click"),
+            AgentStep(step_number=i, action=action)
+            for i, action in enumerate(("screenshot", "click"), start=1)
         ]
         result = AgentResult(
             success=True,
@@ -0,0 +1,184 @@
+"""Tests for the native installer."""
+
+import json
+import shutil
+import subprocess
+import time
+
+import httpx
+import pytest
+from rich.console import Console
+
+from deskpilot.installer import native
+from deskpilot.installer.native import NativeInstaller, Platform
+from deskpilot.wizard.config import get_config
+
+OLLAMA_URL = "http://ollama.test:11434"
+
+
+@pytest.fixture(autouse=True)
+def quiet_console(monkeypatch):
+    """Silence the installer's console and progress output."""
+    monkeypatch.setattr(native, "console", Console(quiet=True))
+
+
+@pytest.fixture
+def skill_paths(tmp_path, monkeypatch):
+    """Point the installer at a scratch skill source and home directory."""
+    src = tmp_path / "src" / "computer-use"
+    shutil.copytree(native.SKILL_SOURCE, src)
+    monkeypatch.setattr(native, "SKILL_SOURCE", src)
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    return src, tmp_path / "home" / ".openclaw" / "skills" / "computer-use"
+
+
+def ollama_installer(handler) -> NativeInstaller:
+    """Create an installer whose Ollama API calls are answered by `handler`."""
+    installer = NativeInstaller(ollama_url=OLLAMA_URL)
+    installer._http = httpx.Client(base_url=OLLAMA_URL, transport=httpx.MockTransport(handler))
+    return installer
+
+
+def ndjson(*events: dict) -> bytes:
+    """Encode events the way Ollama streams them."""
+    return b"".join(json.dumps(event).encode() + b"\n" for event in events)
+
+
+class TestInstallSkill:
+    """Tests for installing the OpenClaw skill."""
+
+    def test_skips_up_to_date_install(self, skill_paths):
+        """Test that an intact install is left alone."""
+        installer = NativeInstaller()
+
+        assert "installed" in installer.install_skill().message
+        result = installer.install_skill()
+
+        assert result.success
+        assert "already up to date" in result.message
+
+    def test_reinstalls_changed_source(self, skill_paths):
+        """Test that edits to the skill source are copied over."""
+        src, dest = skill_paths
+        installer = NativeInstaller()
+        installer.install_skill()
+
+        (src / "SKILL.md").write_text("name: computer-use\nupdated\n")
+        result = installer.install_skill()
+
+        assert "installed" in result.message
+        assert (dest / "SKILL.md").read_text() == "name: computer-use\nupdated\n"
+
+    def test_repairs_damaged_install(self, skill_paths):
+        """Test that a missing file in the install is restored."""
+        _, dest = skill_paths
+        installer = NativeInstaller()
+        installer.install_skill()
+
+        (dest / "SKILL.md").unlink()
+        result = installer.install_skill()
+
+        assert "installed" in result.message
+        assert (dest / "SKILL.md").exists()
+
+
+class TestOllamaApi:
+    """Tests for the installer's Ollama HTTP client."""
+
+    def test_url_defaults_to_config(self):
+        """Test that the Ollama URL comes from the model config."""
+        assert NativeInstaller().ollama_url == get_config().model.base_url
+
+    def test_pull_model_streams_progress(self):
+        """Test a pull that streams progress and completes."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(
+                200,
+                content=ndjson(
+                    {"status": "pulling manifest"},
+                    {"status": "downloading", "total": 100, "completed": 50},
+                    {"status": "success"},
+                ),
+            )
+
+        result = ollama_installer(handler).pull_model()
+
+        assert result.success
+        assert requests[0].url.path == "/api/pull"
+        assert json.loads(requests[0].content) == {"model": "qwen2.5:3b"}
+
+    def test_pull_model_error_event(self):
+        """Test that an error event in the stream fails the pull."""
+
+        def handler(request):
+            return httpx.Response(
+                200, content=ndjson({"status": "pulling manifest"}, {"error": "model not found"})
+            )
+
+        result = ollama_installer(handler).pull_model()
+
+        assert not result.success
+        assert result.details == "model not found"
+
+    def test_pull_model_http_error(self):
+        """Test that an HTTP error status fails the pull."""
+        result = ollama_installer(lambda request: httpx.Response(500)).pull_model()
+
+        assert not result.success
+        assert "500" in result.details
+
+    def test_pull_model_deadline(self, monkeypatch):
+        """Test that a pull running past the deadline is abandoned."""
+        monkeypatch.setattr(native, "MODEL_PULL_TIMEOUT", -1.0)
+
+        def handler(request):
+            return httpx.Response(200, content=ndjson({"status": "downloading"}))
+
+        result = ollama_installer(handler).pull_model()
+
+        assert not result.success
+        assert "did not finish" in result.details
+
+    def test_start_service_when_running(self, monkeypatch):
+        """Test that a live daemon is not started again."""
+
+        def popen(*args, **kwargs):
+            raise AssertionError("ollama serve should not be started")
+
+        monkeypatch.setattr(subprocess, "Popen", popen)
+
+        result = ollama_installer(lambda request: httpx.Response(200)).start_ollama_service()
+
+        assert result.message == "Ollama service running"
+
+    def test_start_service_polls_until_live(self, monkeypatch):
+        """Test that starting the daemon polls until it answers."""
+        probes = []
+        started = []
+        monkeypatch.setattr(subprocess, "Popen", lambda args, **kwargs: started.append(args))
+        monkeypatch.setattr(time, "sleep", lambda seconds: None)
+
+        def handler(request):
+            probes.append(request.url.path)
+            return httpx.Response(200 if len(probes) > 3 else 503)
+
+        installer = ollama_installer(handler)
+        installer.platform = Platform.LINUX
+        result = installer.start_ollama_service()
+
+        assert result.message == "Ollama service started"
+        assert started == [["ollama", "serve"]]
+        assert probes == ["/api/tags"] * 4
+
+    def test_run_closes_client(self, monkeypatch):
+        """Test that run() closes the keep-alive client when it finishes."""
+        installer = ollama_installer(lambda request: httpx.Response(200))
+        client = installer._http
+        monkeypatch.setattr(installer, "_run", lambda: True)
+
+        assert installer.run()
+        assert client.is_closed
+        assert installer._http is None
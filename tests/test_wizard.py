@@ -1,111 +1,195 @@
 """Tests for the setup wizard."""
 
+import ctypes
 import platform
+import subprocess
+from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
 
-from deskpilot.wizard.setup import check_dependencies, detect_environment
+from deskpilot.cua_bridge.agent import MockAgent
+from deskpilot.wizard import setup
+from deskpilot.wizard.setup import _macos_ram_bytes, check_dependencies, detect_environment
+
+_SKILL_SOURCE = (
+    Path(__file__).parent.parent / "src" / "deskpilot" / "openclaw_skill" / "computer-use"
+)
+_SKILL_MD_PATH = _SKILL_SOURCE / "SKILL.md"
+# Read once at import; the skill tests only inspect the text
+_SKILL_MD = _SKILL_MD_PATH.read_text() if _SKILL_MD_PATH.exists() else ""
+
+
+@pytest.fixture
+def fresh_caches():
+    """Drop cached probe and environment results before and after a faked-host test."""
+    setup.clear_cache()
+    yield
+    setup.clear_cache()
+
+
+@pytest.fixture(scope="session")
+def env():
+    """Detect the environment once for the whole run."""
+    return detect_environment()
+
+
+_FAKE_TOOLS = {"ollama": "/usr/local/bin/ollama", "openclaw": None, "node": "/usr/bin/node"}
+
+
+def _ollama_not_running(base_url, timeout=1.0, client=None):
+    return False
+
+
+@pytest.fixture(scope="session")
+async def dep_results():
+    """Run the dependency checks once against a fake Linux host, without console output."""
+    with (
+        patch("deskpilot.wizard.setup._console"),
+        patch.multiple(
+            "deskpilot.wizard._probes",
+            which=_FAKE_TOOLS.get,
+            system=lambda: "Linux",
+            python_version_tuple=lambda: ("3", "12", "4"),
+            native_packages_available=lambda: True,
+            node_major_version=lambda: 20,
+            ollama_running=_ollama_not_running,
+        ),
+    ):
+        return await check_dependencies()
+
+
+@pytest.fixture(scope="module")
+def demo_mod():
+    """Import the demo module once; importing it is itself under test."""
+    import deskpilot.wizard.demo
+
+    return deskpilot.wizard.demo
 
 
 class TestDetectEnvironment:
     """Tests for environment detection."""
 
-    def test_detect_environment_returns_dict(self):
+    def test_detect_environment_returns_dict(self, env):
         """Test that detect_environment returns expected keys."""
-        env = detect_environment()
-
         assert "os" in env
         assert "os_version" in env
         assert "python_version" in env
         assert "arch" in env
         assert "ram_gb" in env
 
-    def test_detect_environment_os(self):
+    def test_detect_environment_os(self, env):
         """Test OS detection matches platform."""
-        env = detect_environment()
-
         assert env["os"] == platform.system()
 
-    def test_detect_environment_python_version(self):
+    def test_detect_environment_python_version(self, env):
         """Test Python version detection."""
-        env = detect_environment()
-
         assert env["python_version"] == platform.python_version()
 
-    def test_detect_environment_ram_positive(self):
+    def test_detect_environment_ram_positive(self, env):
         """Test RAM detection returns positive value."""
-        env = detect_environment()
-
         assert env["ram_gb"] > 0
 
+    def test_detect_environment_on_macos(self, fresh_caches):
+        """Test detection on a macOS host reads RAM via sysctl."""
+        with (
+            patch.object(platform, "system", return_value="Darwin"),
+            patch.object(setup, "_macos_ram_bytes", return_value=32 * 1024**3),
+        ):
+            env = detect_environment()
+
+        assert env["os"] == "Darwin"
+        assert env["ram_gb"] == 32
+
+
+class TestMacosRam:
+    """Tests for reading RAM size on macOS."""
+
+    def test_sysctlbyname_fast_path(self):
+        """Test RAM is read through sysctlbyname with a correct C signature."""
+
+        def sysctlbyname(name, oldp, oldlenp, newp, newlen):
+            assert name == b"hw.memsize"
+            oldp._obj.value = 16 * 1024**3
+            return 0
+
+        libc = SimpleNamespace(sysctlbyname=sysctlbyname)
+        with (
+            patch.object(ctypes, "CDLL", return_value=libc),
+            patch.object(subprocess, "run") as run,
+        ):
+            assert _macos_ram_bytes() == 16 * 1024**3
+
+        run.assert_not_called()
+        assert sysctlbyname.restype is ctypes.c_int
+        assert sysctlbyname.argtypes[-1] is ctypes.c_size_t
+
+    def test_sysctl_fallback(self):
+        """Test RAM falls back to the sysctl CLI when libc cannot be loaded."""
+        completed = subprocess.CompletedProcess(["sysctl"], 0, stdout="17179869184\n")
+        with (
+            patch.object(ctypes, "CDLL", side_effect=OSError("no libc")),
+            patch.object(subprocess, "run", return_value=completed) as run,
+        ):
+            assert _macos_ram_bytes() == 17179869184
+
+        assert run.call_args.args[0] == ["sysctl", "-n", "hw.memsize"]
+
 
 class TestCheckDependencies:
     """Tests for dependency checking."""
 
-    @pytest.mark.asyncio
-    async def test_check_dependencies_returns_dict(self):
+    async def test_check_dependencies_returns_dict(self, dep_results):
         """Test that check_dependencies returns expected keys."""
-        # Capture console output
-        with patch("deskpilot.wizard.setup.console"):
-            results = await check_dependencies()
-
-        assert isinstance(results, dict)
-        assert "python_3.11+" in results
-        assert "ollama" in results
-        assert "ollama_running" in results
-        assert "native-packages" in results
-        assert "openclaw" in results
-        assert "node_18+" in results
-
-    @pytest.mark.asyncio
-    async def test_python_version_check(self):
+        assert isinstance(dep_results, dict)
+        assert "python_3.11+" in dep_results
+        assert "ollama" in dep_results
+        assert "ollama_running" in dep_results
+        assert "native-packages" in dep_results
+        assert "openclaw" in dep_results
+        assert "node_18+" in dep_results
+
+    async def test_python_version_check(self, dep_results):
         """Test Python version requirement check."""
-        with patch("deskpilot.wizard.setup.console"):
-            results = await check_dependencies()
-
-        # We're running on Python 3.11+, so this should be True
-        py_version = platform.python_version_tuple()
-        expected = int(py_version[0]) >= 3 and int(py_version[1]) >= 11
-        assert results["python_3.11+"] == expected
+        # The fake host reports Python 3.12.4
+        assert dep_results["python_3.11+"] is True
 
-    @pytest.mark.asyncio
-    async def test_os_detection_flags(self):
+    async def test_os_detection_flags(self, dep_results):
         """Test OS detection flags are mutually exclusive."""
-        with patch("deskpilot.wizard.setup.console"):
-            results = await check_dependencies()
-
-        os_flags = [results["is_windows"], results["is_macos"], results["is_linux"]]
+        os_flags = [dep_results["is_windows"], dep_results["is_macos"], dep_results["is_linux"]]
         # Exactly one should be True (or none on exotic OS)
         assert sum(os_flags) <= 1
+        assert dep_results["is_linux"]
+
+    async def test_tool_availability(self, dep_results):
+        """Test tool checks reflect what the host probes report."""
+        assert dep_results["ollama"] is True
+        assert dep_results["ollama_running"] is False
+        assert dep_results["native-packages"] is True
+        assert dep_results["openclaw"] is False
+        assert dep_results["node_18+"] is True
 
 
 class TestSetupWizardFlow:
     """Tests for the setup wizard flow."""
 
-    @pytest.mark.asyncio
-    async def test_wizard_detects_environment(self):
+    async def test_wizard_detects_environment(self, env):
         """Test that wizard properly detects environment."""
-        env = detect_environment()
-
         # Should have all required keys
         required_keys = ["os", "os_version", "python_version", "arch", "ram_gb"]
         for key in required_keys:
             assert key in env
 
-    @pytest.mark.asyncio
-    async def test_check_dependencies_os_flags(self):
+    async def test_check_dependencies_os_flags(self, dep_results):
         """Test that check_dependencies includes OS flags."""
-        with patch("deskpilot.wizard.setup.console"):
-            results = await check_dependencies()
-
         # Should have OS detection flags
-        assert "is_windows" in results
-        assert "is_macos" in results
-        assert "is_linux" in results
+        assert "is_windows" in dep_results
+        assert "is_macos" in dep_results
+        assert "is_linux" in dep_results
 
         # Exactly one should be True (or none on exotic OS)
-        os_flags = [results["is_windows"], results["is_macos"], results["is_linux"]]
+        os_flags = [dep_results["is_windows"], dep_results["is_macos"], dep_results["is_linux"]]
         assert sum(os_flags) <= 1
 
 
@@ -114,61 +198,36 @@ class TestSkillInstallation:
 
     def test_skill_source_path_exists(self):
         """Test that the skill source path is valid."""
-        from pathlib import Path
-
-        skill_path = (
-            Path(__file__).parent.parent
-            / "src"
-            / "deskpilot"
-            / "openclaw_skill"
-            / "computer-use"
-        )
         # Path should exist after project setup
-        assert skill_path.exists(), f"Skill path not found: {skill_path}"
+        assert _SKILL_SOURCE.exists(), f"Skill path not found: {_SKILL_SOURCE}"
 
+    @pytest.mark.skipif(not _SKILL_MD, reason="SKILL.md not present")
     def test_skill_md_content(self):
         """Test that SKILL.md has required content."""
-        from pathlib import Path
-
-        skill_path = (
-            Path(__file__).parent.parent
-            / "src"
-            / "deskpilot"
-            / "openclaw_skill"
-            / "computer-use"
-            / "SKILL.md"
-        )
-
-        if skill_path.exists():
-            content = skill_path.read_text()
+        lowered = _SKILL_MD.lower()
 
-            # Check for required sections
-            assert "name: computer-use" in content
-            assert "deskpilot" in content.lower()
-            assert "screenshot" in content.lower()
-            assert "click" in content.lower()
+        # Check for required sections
+        assert "name: computer-use" in _SKILL_MD
+        assert "deskpilot" in lowered
+        assert "screenshot" in lowered
+        assert "click" in lowered
 
 
 class TestDemoModule:
     """Tests for the demo module."""
 
-    @pytest.mark.asyncio
-    async def test_demo_import(self):
+    async def test_demo_import(self, demo_mod):
         """Test that demo module imports correctly."""
-        from deskpilot.wizard.demo import run_calculator_demo, run_quick_demo
+        assert callable(demo_mod.run_calculator_demo)
+        assert callable(demo_mod.run_quick_demo)
 
-        assert callable(run_calculator_demo)
-        assert callable(run_quick_demo)
-
-    @pytest.mark.asyncio
-    async def test_quick_demo_mock_mode(self):
+    async def test_quick_demo_mock_mode(self, demo_mod):
         """Test quick demo in mock mode doesn't crash."""
-        from deskpilot.wizard.demo import run_quick_demo
-
-        # Suppress console output
+        # Suppress console output and MockAgent's pacing delay
         with (
             patch("deskpilot.wizard.demo.console"),
             patch("deskpilot.cua_bridge.agent.console"),
+            patch.object(MockAgent, "step_delay", 0),
         ):
             # Should complete without error in mock mode
-            await run_quick_demo(mock=True)
+            await demo_mod.run_quick_demo(mock=True)